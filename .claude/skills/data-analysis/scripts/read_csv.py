@@ -13,10 +13,27 @@ Options:
     --encoding <enc>            File encoding (default: auto-detect)
     --sep <char>                Delimiter (default: auto-detect)
     --no-data                   Profile only — do not print rows
+    --engine <pyarrow|c>        CSV parser (default: pyarrow if installed;
+                                c under Modin, whose read_csv is already parallel)
+    --no-cache                  Recompute the profile even if a cached one matches
+
+Profiles are cached beside the input as <file>.profile.json and reused while
+the file's mtime and size (and the encoding/sep/engine options) are unchanged.
+
+Environment:
+    CSV_PROFILE_ENGINE=modin    Run pandas operations on all cores via Modin
+                                (MODIN_ENGINE defaults to ray). Only pays off on
+                                large files: worker startup adds seconds per run.
+                                With --engine pyarrow, columns are handed to Modin
+                                as numpy dtypes rather than Arrow ones.
 
 Auto-installs: pandas, tabulate, chardet
+Optional: pyarrow (multi-threaded CSV parsing, Arrow-backed columns),
+          cchardet (faster encoding detection), orjson (faster JSON output),
+          modin (see CSV_PROFILE_ENGINE)
 """
 
+import os
 import sys
 import subprocess
 
@@ -32,6 +49,16 @@ except ImportError:
     _install("pandas")
     import pandas as pd
 
+MODIN = os.environ.get("CSV_PROFILE_ENGINE") == "modin"
+if MODIN:
+    os.environ.setdefault("MODIN_ENGINE", "ray")
+    try:
+        import modin.pandas as pd
+    except ImportError:
+        print('CSV_PROFILE_ENGINE=modin needs modin (pip install "modin[ray]"); using pandas',
+              file=sys.stderr)
+        MODIN = False
+
 try:
     from tabulate import tabulate
 except ImportError:
@@ -46,46 +73,287 @@ except ImportError:
     _install("chardet")
     import chardet
 
+try:
+    from cchardet import UniversalDetector  # optional C implementation, same interface
+except ImportError:
+    UniversalDetector = chardet.UniversalDetector
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pc = pa_csv = None
+
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+from pandas.util import hash_pandas_object
+
 import argparse
+import io
 import json
-import os
+from collections import Counter
 from pathlib import Path
 
+import numpy as np
+
+SNIFF_BYTES = 65536  # header sample shared by the encoding/delimiter detectors
+SNIFF_CHUNK = 4096
+WHOLE_READ_BYTES = 200 * 1024 ** 2  # full reads of files up to this size go via memory
+NUMERIC_SAMPLE = 1000  # values checked before attempting a numeric parse
+NUMERIC_PATTERN = r"^[\s$+-]*[\d,.$ ]+([eE][-+]?\d+)?\s*$"
+NUMERIC_STRIP = r"[,$]"  # thousands separators and currency signs
+INFER_SAMPLE = 1_000_000  # rows tried before converting a whole column
+DATETIME_MIN_VALID = 0.95  # share of sampled values that must parse as dates
+STREAM_PROFILE_BYTES = 256 * 1024 ** 2  # profile-only runs above this size stream
+PROFILE_CHUNK = 500_000  # rows per chunk when streaming
+UNIQUE_CAP = 100_000  # distinct values tracked per column when streaming
+STREAM_TABLE_ROWS = 10_000  # larger markdown outputs are written row by row
+COUNT_BLOCK = 1024 ** 2  # bytes per read when counting a file's rows
+PROFILE_CACHE_VERSION = 2  # bump when the profile or sidecar format changes
+MISSING_BARS = ["█" * k + "░" * (20 - k) for k in range(21)]  # one per 5% step
+
+
+def read_source(path: Path, whole: bool = False) -> tuple[bytes, bytes | None]:
+    """Read the header sample for the detectors, and the whole file if asked.
+
+    With whole=True the file is read once and the header is sliced from it,
+    so the parser can work from memory instead of reopening the file.
+    """
+    with open(path, "rb") as f:
+        if not whole:
+            return f.read(SNIFF_BYTES), None
+        data = f.read()
+    return data[:SNIFF_BYTES], data
+
+
+def detect_encoding(sample: bytes) -> str:
+    """Auto-detect encoding, stopping as soon as the detector is confident."""
+    detector = UniversalDetector()
+    for start in range(0, len(sample), SNIFF_CHUNK):
+        detector.feed(sample[start:start + SNIFF_CHUNK])
+        if detector.done:
+            break
+    detector.close()
+    return detector.result.get("encoding") or "utf-8"
+
+
+def detect_sep(sample: bytes) -> str:
+    """Auto-detect delimiter by counting candidate bytes in the first line."""
+    first_line = sample.split(b"\n", 1)[0]
+    counts = {sep: first_line.count(sep.encode()) for sep in [",", "\t", ";", "|"]}
+    return max(counts, key=counts.get)
 
-def detect_encoding(path: Path) -> str:
-    """Auto-detect file encoding."""
-    raw = path.read_bytes()[:65536]  # sample first 64KB
-    result = chardet.detect(raw)
-    return result.get("encoding") or "utf-8"
 
+def _arrow_dtype(pa_type):
+    """types_mapper for to_pandas: keep Arrow storage, except temporal/null columns."""
+    if pa.types.is_temporal(pa_type):
+        return None  # numpy datetime64, so .min().date() etc. behave as usual
+    if pa.types.is_null(pa_type):
+        return None  # all-empty column; a plain object column of None
+    return pd.ArrowDtype(pa_type)
+
+
+def _dedupe_names(names: list[str]) -> list[str]:
+    """Rename repeated headers like pandas' C parser: a, a.1, a.2, ...
+
+    Suffixes skip any name already present in the header.
+    """
+    used, seen, counts = set(names), set(), {}
+    out = []
+    for name in names:
+        if name in seen:
+            k = counts.get(name, 0) + 1
+            while f"{name}.{k}" in used:
+                k += 1
+            counts[name] = k
+            name = f"{name}.{k}"
+            used.add(name)
+        seen.add(name)
+        out.append(name)
+    return out
+
+
+def read_frame(source: Path | bytes, sep: str, encoding: str, engine: str,
+               nrows: int | None = None) -> pd.DataFrame:
+    """Read the CSV (a path or its bytes) with the requested engine.
+
+    If nrows is given, only the first nrows rows are read.
+    """
+    if engine == "pyarrow":
+        path = pa.BufferReader(source) if isinstance(source, bytes) else source
+        options = dict(
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+            read_options=pa_csv.ReadOptions(encoding=encoding, use_threads=True),
+            # Match pandas: empty fields in text columns are missing, not ""
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+        )
+        try:
+            if nrows is None:
+                table = pa_csv.read_csv(path, **options)
+            else:
+                # Stream record batches and stop once enough rows are in
+                reader = pa_csv.open_csv(path, **options)
+                batches, n = [], 0
+                for batch in reader:
+                    batches.append(batch)
+                    n += batch.num_rows
+                    if n >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+            if len(set(table.column_names)) < table.num_columns:
+                table = table.rename_columns(_dedupe_names(table.column_names))
+            if MODIN:
+                # Modin's reductions mishandle ArrowDtype columns; hand it numpy ones
+                return pd.DataFrame(table.to_pandas(split_blocks=True, self_destruct=True,
+                                                    date_as_object=False))
+            return table.to_pandas(split_blocks=True, self_destruct=True,
+                                   date_as_object=False, types_mapper=_arrow_dtype)
+        except pa.ArrowInvalid as e:
+            print(f"pyarrow could not parse file ({e}); falling back to C engine",
+                  file=sys.stderr)
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    # A pyarrow fallback still returns Arrow-backed columns, as the caller asked
+    backend = {"dtype_backend": "pyarrow"} if engine == "pyarrow" and not MODIN else {}
+    df = pd.read_csv(source, sep=sep, encoding=encoding, low_memory=False, nrows=nrows,
+                     **backend)
+    if backend:
+        # As _arrow_dtype does: all-empty columns become plain object columns
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype):
+                df[col] = df[col].astype(object)
+    return df
 
-def detect_sep(path: Path, encoding: str) -> str:
-    """Auto-detect delimiter by checking first few lines."""
-    with open(path, encoding=encoding, errors="replace") as f:
-        sample = f.readline()
-    counts = {sep: sample.count(sep) for sep in [",", "\t", ";", "|"]}
-    return max(counts, key=counts.get)
+
+def count_rows(path: Path, sep: str, encoding: str) -> int | None:
+    """Data rows in the file (header excluded), for previews that stopped early.
+
+    Newline bytes are counted block by block, without parsing. Quoted fields
+    can hold newlines and the parsers skip blank lines, so a file with either
+    (or in a UTF-16/32 encoding) is counted by parsing its first column
+    instead. Returns None if that parse fails, as a full read would too.
+    """
+    if not encoding.lower().replace("-", "").replace("_", "").startswith(("utf16", "utf32")):
+        newlines, last = 0, b"\n"
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(COUNT_BLOCK), b""):
+                if (b'"' in block or b"\n\n" in block or b"\n\r\n" in block
+                        or last == b"\n" and block[:1] in (b"\n", b"\r")):
+                    break
+                newlines += block.count(b"\n")
+                last = block[-1:]
+            else:
+                return max(newlines + (last != b"\n") - 1, 0)
+    try:
+        reader = pd.read_csv(path, sep=sep, encoding=encoding, usecols=[0],
+                             chunksize=PROFILE_CHUNK)
+        return sum(len(chunk) for chunk in reader)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _guess_format(s: pd.Series) -> str | None:
+    """Guess a strptime format from the first non-null value."""
+    first = s.dropna().head(1)
+    return guess_datetime_format(str(first.iloc[0])) if len(first) else None
+
+
+def _mostly_dates(parsed: pd.Series, raw: pd.Series) -> bool:
+    return parsed.notna().sum() > DATETIME_MIN_VALID * raw.notna().sum()
+
+
+def _to_numeric(s: pd.Series) -> pd.Series:
+    return pd.to_numeric(s.str.replace(NUMERIC_STRIP, "", regex=True), errors="raise")
 
 
 def infer_types(df: pd.DataFrame) -> pd.DataFrame:
-    """Attempt to parse date columns and improve type inference."""
+    """Attempt to parse date columns and improve type inference.
+
+    Each candidate conversion is first tried on the leading INFER_SAMPLE
+    rows, so a column that won't convert costs a bounded amount of work.
+    """
+    sampled = len(df) > INFER_SAMPLE
     for col in df.columns:
-        # Try datetime
-        if df[col].dtype == object:
+        # Only text columns need work; Arrow already typed numbers and dates
+        if df[col].dtype.kind in "OU":
+            head = df[col].head(INFER_SAMPLE)
+            # Try datetime
             if any(kw in col.lower() for kw in ["date", "time", "dt", "year", "month"]):
                 try:
-                    df[col] = pd.to_datetime(df[col], errors="coerce")
-                    continue
+                    # An explicit format avoids per-value dateutil parsing
+                    fmt = _guess_format(head)
+                    parsed = pd.to_datetime(head, format=fmt, errors="coerce")
+                    if fmt and not _mostly_dates(parsed, head):
+                        fmt = "mixed"  # mixed formats; parse each value on its own
+                        parsed = pd.to_datetime(head, format=fmt, errors="coerce")
+                    if _mostly_dates(parsed, head):
+                        df[col] = (pd.to_datetime(df[col], format=fmt, errors="coerce")
+                                   if sampled else parsed)
+                        continue
                 except Exception:
                     pass
-            # Try numeric
+            # Try numeric, unless a sample of values clearly isn't. Object
+            # columns can hold non-strings (e.g. datetime.time from Arrow).
+            sample = df[col].dropna().head(NUMERIC_SAMPLE)
+            if not (pd.api.types.is_string_dtype(sample)
+                    and sample.str.match(NUMERIC_PATTERN).all()):
+                continue
             try:
-                df[col] = pd.to_numeric(df[col].str.replace(",", "").str.replace("$", ""), errors="raise")
+                if sampled:
+                    _to_numeric(head)  # fail fast before touching the full column
+                df[col] = _to_numeric(df[col])
             except Exception:
                 pass
     return df
 
 
+def _arrow_data(s: pd.Series):
+    """The pyarrow ChunkedArray behind an ArrowDtype column, else None."""
+    if pa is not None and isinstance(s.dtype, pd.ArrowDtype):
+        return s.array._pa_array
+    return None
+
+
+def _nunique(s: pd.Series) -> int:
+    data = _arrow_data(s)
+    if data is not None:
+        return pc.count_distinct(data, mode="only_valid").as_py()
+    return s.nunique()
+
+
+def _top_values(s: pd.Series, k: int = 5) -> list[tuple]:
+    """The k most frequent non-null values with their counts.
+
+    Arrow-backed columns use pyarrow.compute.value_counts directly. Others
+    are factorized once and the integer codes counted with np.bincount,
+    instead of value_counts' hash-count. Either way ties keep first-seen
+    order, as value_counts does.
+    """
+    data = _arrow_data(s)
+    if data is not None:
+        vc = pc.value_counts(data)  # first-seen order; null counted as a value
+        values, counts = vc.field("values"), vc.field("counts")
+        valid = pc.is_valid(values)
+        values, counts = values.filter(valid), counts.filter(valid)
+        top = pc.array_sort_indices(counts, order="descending")[:k]  # stable
+        return list(zip(values.take(top).to_pylist(), counts.take(top).to_pylist()))
+
+    codes, uniques = pd.factorize(s)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    # A stable sort over the distinct values; argpartition would pick
+    # arbitrary members of a tie at the k-th count
+    top = np.argsort(-counts, kind="stable")[:k]
+    return list(zip(uniques[top], counts[top]))
+
+
 def profile(df: pd.DataFrame, path: Path) -> str:
     """Full statistical profile of the dataframe."""
     lines = []
@@ -94,23 +362,37 @@ def profile(df: pd.DataFrame, path: Path) -> str:
     lines.append(f"**Dimensions:** {df.shape[0]:,} rows × {df.shape[1]} columns")
     lines.append(f"**File size:** {path.stat().st_size / 1024:.1f} KB\n")
 
+    # Frame-wide reductions, looked up per column below
+    kinds = df.dtypes.apply(lambda d: d.kind)  # numpy kind codes, also set by ArrowDtype
+    null_counts = df.isna().sum()
+    nuniques = pd.Series({col: _nunique(df[col]) for col in df.columns}, dtype=int)
+    # A column with a distinct non-null value in every row rules out duplicate
+    # rows, so the row-hashing pass only runs when no such key column exists
+    has_key = ((nuniques == len(df)) & (null_counts == 0)).any()
+    dupe_count = 0 if has_key else df.duplicated().sum()
+    num_df = df.select_dtypes(include="number")
+    num_stats = num_df.agg(["min", "mean", "max"]) if not num_df.empty else pd.DataFrame()
+
     # Column summary
     col_rows = []
+    top_values = {}
     for col in df.columns:
         dtype = str(df[col].dtype)
-        n_valid = df[col].notna().sum()
-        null_pct = df[col].isna().sum() / len(df) * 100
-        n_unique = df[col].nunique()
-
-        if df[col].dtype in ["float64", "int64"]:
-            summary = (f"min={df[col].min():.2g}, "
-                       f"mean={df[col].mean():.2g}, "
-                       f"max={df[col].max():.2g}")
-        elif str(df[col].dtype).startswith("datetime"):
+        n_valid = len(df) - null_counts[col]
+        null_pct = null_counts[col] / len(df) * 100
+        n_unique = nuniques[col]
+
+        kind = kinds[col]
+        if kind in "iuf":
+            stats = num_stats[col]
+            summary = (f"min={stats['min']:.2g}, "
+                       f"mean={stats['mean']:.2g}, "
+                       f"max={stats['max']:.2g}")
+        elif kind == "M":
             summary = f"{df[col].min().date()} → {df[col].max().date()}"
         else:
-            top = df[col].value_counts().index[:3].tolist()
-            summary = ", ".join(str(v) for v in top)
+            top_values[col] = _top_values(df[col])
+            summary = ", ".join(str(v) for v, _ in top_values[col][:3])
             if len(summary) > 50:
                 summary = summary[:47] + "..."
 
@@ -126,7 +408,6 @@ def profile(df: pd.DataFrame, path: Path) -> str:
     lines.append("")
 
     # Numeric stats
-    num_df = df.select_dtypes(include="number")
     if not num_df.empty:
         lines.append("\n## Numeric Statistics\n")
         desc = num_df.describe().T.round(3)
@@ -134,7 +415,7 @@ def profile(df: pd.DataFrame, path: Path) -> str:
         lines.append("")
 
     # Date ranges
-    dt_cols = df.select_dtypes(include=["datetime64[ns]"]).columns
+    dt_cols = kinds.index[kinds == "M"]
     if len(dt_cols) > 0:
         lines.append("\n## Date Ranges\n")
         for col in dt_cols:
@@ -144,37 +425,34 @@ def profile(df: pd.DataFrame, path: Path) -> str:
         lines.append("")
 
     # Categorical overview
-    cat_cols = df.select_dtypes(include="object").columns
+    cat_cols = kinds.index[kinds.isin(["O", "U"])]
     if len(cat_cols) > 0:
         lines.append("\n## Top Values (Categorical)\n")
         for col in cat_cols[:6]:  # limit to first 6 categorical cols
-            vc = df[col].value_counts().head(5)
-            lines.append(f"**{col}** ({df[col].nunique()} unique):")
-            for val, cnt in vc.items():
+            lines.append(f"**{col}** ({nuniques[col]} unique):")
+            for val, cnt in top_values[col]:
                 pct = cnt / len(df) * 100
                 lines.append(f"  - `{val}`: {cnt:,} ({pct:.1f}%)")
         lines.append("")
 
     # Missing value heatmap (text-based)
-    missing = df.isnull().sum()
-    missing = missing[missing > 0].sort_values(ascending=False)
+    missing = null_counts[null_counts > 0].sort_values(ascending=False)
     if not missing.empty:
         lines.append("\n## Missing Values\n")
         for col, cnt in missing.items():
             pct = cnt / len(df) * 100
-            bar = "█" * int(pct / 5) + "░" * (20 - int(pct / 5))
+            bar = MISSING_BARS[min(20, int(pct / 5))]
             lines.append(f"  {col:30s} {bar} {pct:.1f}% ({cnt:,})")
         lines.append("")
 
     # Data quality flags
     flags = []
-    dupe_count = df.duplicated().sum()
     if dupe_count > 0:
         flags.append(f"⚠️  **{dupe_count:,} duplicate rows** detected")
     if missing.sum() > 0:
         flags.append(f"⚠️  **{missing.sum():,} total missing values** across {len(missing)} columns")
     # Check for constant columns
-    const_cols = [c for c in df.columns if df[c].nunique() <= 1]
+    const_cols = nuniques.index[nuniques <= 1].tolist()
     if const_cols:
         flags.append(f"⚠️  **Constant columns** (zero variance): {', '.join(const_cols)}")
 
@@ -189,6 +467,314 @@ def profile(df: pd.DataFrame, path: Path) -> str:
     return "\n".join(lines)
 
 
+def _conform(chunk: pd.DataFrame, kinds: dict) -> pd.DataFrame:
+    """Coerce a later chunk to the column kinds inferred from the first one."""
+    for col, kind in kinds.items():
+        have = chunk[col].dtype.kind
+        if kind == "M" and have != "M":
+            chunk[col] = pd.to_datetime(chunk[col], format=_guess_format(chunk[col]),
+                                        errors="coerce")
+        elif kind in "iuf" and have not in "iuf":
+            s = chunk[col]
+            if have in "OU":
+                s = s.str.replace(NUMERIC_STRIP, "", regex=True)
+            chunk[col] = pd.to_numeric(s, errors="coerce")
+        elif kind in "OU" and have not in "OU":
+            s = chunk[col]
+            # A bool column holds True/False objects once a NaN appears; keep
+            # them bools so they count and hash like that chunk's values
+            chunk[col] = s.astype(object) if have == "b" else s.where(s.isna(), s.astype(str))
+    return chunk
+
+
+def _hash_rows(chunk: pd.DataFrame, num_cols: list, dt_cols: list) -> np.ndarray:
+    """64-bit row hashes on a fixed per-column dtype, comparable across chunks.
+
+    A chunk's dtypes can drift (int64 -> float64 once a NaN appears, bool ->
+    object), and equal rows hash differently under different dtypes.
+    Timezone-aware dates are hashed as their naive UTC time.
+    """
+    fixed = {}
+    for col in chunk.columns:
+        s = chunk[col]
+        if col in num_cols:
+            s = s.astype("float64")
+        elif col in dt_cols:
+            if isinstance(s.dtype, pd.DatetimeTZDtype):
+                s = s.dt.tz_convert(None)
+            s = s.astype("datetime64[ns]")
+        else:
+            s = s.astype(object)
+        fixed[col] = s
+    return hash_pandas_object(pd.DataFrame(fixed), index=False).to_numpy()
+
+
+def profile_streaming(path: Path, sep: str, encoding: str) -> tuple[str, int]:
+    """Statistical profile computed chunk by chunk, for files too big to load.
+
+    Column types are inferred on the first chunk and later chunks are coerced
+    to match. Mean/std are merged with Chan's parallel update, unique values
+    and value counts are capped at UNIQUE_CAP per column, and duplicate rows
+    are found from a 64-bit hash per row. Quartiles need the full column, so
+    they are omitted. Returns the markdown and the row count.
+    """
+    reader = pd.read_csv(path, sep=sep, encoding=encoding, chunksize=PROFILE_CHUNK)
+
+    n_rows = 0
+    kinds = dtypes = None
+    null_counts = 0
+    num_n = num_mean = num_m2 = 0
+    num_mins, num_maxs, dt_mins, dt_maxs = [], [], [], []
+    uniques = {}    # numeric/datetime columns: set of values, None once capped
+    counters = {}   # all other columns: Counter of values
+    capped = set()
+    row_hashes = []
+
+    for chunk in reader:
+        if kinds is None:
+            chunk = infer_types(chunk)
+            kinds = {c: chunk[c].dtype.kind for c in chunk.columns}
+            dtypes = {c: str(chunk[c].dtype) for c in chunk.columns}
+            num_cols = [c for c, k in kinds.items() if k in "iuf"]
+            dt_cols = [c for c, k in kinds.items() if k == "M"]
+            text_cols = [c for c, k in kinds.items() if k in "OU"]
+            uniques = {c: set() for c in num_cols + dt_cols}
+            counters = {c: Counter() for c in kinds if c not in uniques}
+        else:
+            chunk = _conform(chunk, kinds)
+
+        n_rows += len(chunk)
+        null_counts = null_counts + chunk.isna().sum()
+        row_hashes.append(_hash_rows(chunk, num_cols, dt_cols))
+
+        if num_cols:
+            num = chunk[num_cols].astype(float)
+            n_b = num.count()
+            mean_b = num.mean().fillna(0.0)
+            m2_b = ((num - mean_b) ** 2).sum()
+            n = n_b + num_n
+            delta = mean_b - num_mean
+            frac = n_b / n.where(n > 0, 1)
+            num_mean = num_mean + delta * frac
+            num_m2 = num_m2 + m2_b + delta ** 2 * num_n * frac
+            num_n = n
+            num_mins.append(num.min())
+            num_maxs.append(num.max())
+        if dt_cols:
+            dt_mins.append(chunk[dt_cols].min())
+            dt_maxs.append(chunk[dt_cols].max())
+
+        for col, seen in uniques.items():
+            if seen is not None:
+                seen.update(chunk[col].dropna().unique())
+                if len(seen) > UNIQUE_CAP:
+                    uniques[col] = None
+                    capped.add(col)
+        for col, counter in counters.items():
+            counter.update(chunk[col].value_counts().to_dict())
+            if len(counter) > UNIQUE_CAP:
+                counters[col] = Counter(dict(counter.most_common(UNIQUE_CAP)))
+                capped.add(col)
+
+    if kinds is None:
+        return f"# CSV Profile: {path.name}\n\nNo rows to profile.", 0
+
+    def n_unique(col):
+        if col in capped:
+            return f">{UNIQUE_CAP:,}"
+        return f"{len(counters[col]) if col in counters else len(uniques[col]):,}"
+
+    if num_cols:
+        num_min = pd.DataFrame(num_mins).min()
+        num_max = pd.DataFrame(num_maxs).max()
+        num_std = np.sqrt(num_m2 / (num_n - 1).where(num_n > 1))
+    if dt_cols:
+        dt_min = pd.DataFrame(dt_mins).min()
+        dt_max = pd.DataFrame(dt_maxs).max()
+
+    lines = []
+
+    lines.append(f"# CSV Profile: {path.name}\n")
+    lines.append(f"**Dimensions:** {n_rows:,} rows × {len(kinds)} columns")
+    lines.append(f"**File size:** {path.stat().st_size / 1024:.1f} KB\n")
+
+    # Column summary
+    col_rows = []
+    for col in kinds:
+        n_valid = n_rows - null_counts[col]
+        null_pct = null_counts[col] / n_rows * 100
+
+        if col in num_cols:
+            summary = (f"min={num_min[col]:.2g}, "
+                       f"mean={num_mean[col]:.2g}, "
+                       f"max={num_max[col]:.2g}")
+        elif col in dt_cols:
+            summary = f"{dt_min[col].date()} → {dt_max[col].date()}"
+        else:
+            top = [v for v, _ in counters[col].most_common(3)]
+            summary = ", ".join(str(v) for v in top)
+            if len(summary) > 50:
+                summary = summary[:47] + "..."
+
+        col_rows.append([col, dtypes[col], f"{n_valid:,}", f"{null_pct:.1f}%",
+                          n_unique(col), summary])
+
+    lines.append("## Column Overview\n")
+    lines.append(tabulate(
+        col_rows,
+        headers=["Column", "Type", "Non-null", "Null %", "Unique", "Summary"],
+        tablefmt="pipe"
+    ))
+    lines.append("")
+
+    # Numeric stats
+    if num_cols:
+        lines.append("\n## Numeric Statistics\n")
+        desc = pd.DataFrame({"count": num_n, "mean": num_mean, "std": num_std,
+                             "min": num_min, "max": num_max}).round(3)
+        lines.append(tabulate(desc, headers="keys", tablefmt="pipe", floatfmt=".3f"))
+        lines.append(f"\n*Streamed in chunks of {PROFILE_CHUNK:,} rows; quartiles omitted.*")
+        lines.append("")
+
+    # Date ranges
+    if dt_cols:
+        lines.append("\n## Date Ranges\n")
+        for col in dt_cols:
+            lines.append(f"- **{col}:** {dt_min[col].date()} → {dt_max[col].date()} "
+                         f"({n_rows - null_counts[col]:,} valid)")
+        lines.append("")
+
+    # Categorical overview
+    if text_cols:
+        lines.append("\n## Top Values (Categorical)\n")
+        for col in text_cols[:6]:  # limit to first 6 categorical cols
+            lines.append(f"**{col}** ({n_unique(col)} unique):")
+            for val, cnt in counters[col].most_common(5):
+                pct = cnt / n_rows * 100
+                lines.append(f"  - `{val}`: {cnt:,} ({pct:.1f}%)")
+        lines.append("")
+
+    # Missing value heatmap (text-based)
+    missing = null_counts[null_counts > 0].sort_values(ascending=False)
+    if not missing.empty:
+        lines.append("\n## Missing Values\n")
+        for col, cnt in missing.items():
+            pct = cnt / n_rows * 100
+            bar = MISSING_BARS[min(20, int(pct / 5))]
+            lines.append(f"  {col:30s} {bar} {pct:.1f}% ({cnt:,})")
+        lines.append("")
+
+    # Data quality flags
+    flags = []
+    hashes = np.concatenate(row_hashes)
+    dupe_count = len(hashes) - len(np.unique(hashes))
+    if dupe_count > 0:
+        flags.append(f"⚠️  **{dupe_count:,} duplicate rows** detected")
+    if missing.sum() > 0:
+        flags.append(f"⚠️  **{missing.sum():,} total missing values** across {len(missing)} columns")
+    # Check for constant columns
+    const_cols = [c for c in kinds if c not in capped
+                  and len(counters[c] if c in counters else uniques[c]) <= 1]
+    if const_cols:
+        flags.append(f"⚠️  **Constant columns** (zero variance): {', '.join(const_cols)}")
+
+    if flags:
+        lines.append("\n## Data Quality Flags\n")
+        lines.extend(flags)
+        lines.append("")
+    else:
+        lines.append("\n## Data Quality\n")
+        lines.append("✅ No obvious quality issues detected.\n")
+
+    return "\n".join(lines), n_rows
+
+
+def _cache_path(path: Path) -> Path:
+    return path.with_name(path.name + ".profile.json")
+
+
+def profile_cache_key(path: Path, encoding: str | None, sep: str | None, engine: str) -> dict:
+    """Identify a profile by the file's mtime/size and the options that shape it."""
+    st = path.stat()
+    return {"version": PROFILE_CACHE_VERSION, "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+            "encoding": encoding, "sep": sep, "engine": engine}
+
+
+def load_cached_profile(path: Path, key: dict) -> dict | None:
+    """Return the cached sidecar (profile markdown, row count, dtypes) if its key matches."""
+    try:
+        cached = json.loads(_cache_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return cached if cached.get("key") == key else None
+
+
+def save_cached_profile(path: Path, key: dict, text: str, n_rows: int,
+                        dtypes: dict | None = None) -> None:
+    """Write the profile sidecar; a read-only directory just means no cache."""
+    payload = {"key": key, "profile": text, "rows": n_rows, "dtypes": dtypes}
+    try:
+        _cache_path(path).write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _stream_markdown(df: pd.DataFrame, file=sys.stdout) -> None:
+    """Write a pipe table row by row instead of rendering it as one string.
+
+    Columns are not padded to a common width, since that would need a pass
+    over every row first; the table renders the same in markdown.
+    """
+    kinds = [d.kind for d in df.dtypes]
+    fmts = ["{:.4f}".format if k in "fc" else str for k in kinds]
+    file.write("| " + " | ".join(map(str, df.columns)) + " |\n")
+    file.write("|" + "|".join("---:" if k in "iufc" else ":---" for k in kinds) + "|\n")
+    for row in df.itertuples(index=False, name=None):
+        file.write("| " + " | ".join(f(v) for f, v in zip(fmts, row)) + " |\n")
+
+
+def _numpy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow-backed columns as numpy ones with NaN for missing, for tabulate.
+
+    tabulate treats a column holding pd.NA as text, which drops the float
+    format and right alignment.
+    """
+    arrow = [col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.ArrowDtype)]
+    if not arrow:
+        return df
+    df = df.copy()
+    for col in arrow:
+        s = df[col]
+        if not s.hasnans and s.dtype.kind in "iufb":
+            df[col] = s.to_numpy(dtype=s.dtype.numpy_dtype)
+        else:
+            df[col] = s.to_numpy(dtype="float64" if s.dtype.kind in "iuf" else object,
+                                 na_value=np.nan)
+    return df
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    """Row dicts for JSON output: ISO-8601 date strings, None for missing values."""
+    out = df.astype(object).where(df.notna(), None)
+    for col in df.columns[[d.kind == "M" for d in df.dtypes]]:
+        s = df[col]
+        # Timezone-aware dates are written in UTC with a Z suffix, as to_json does
+        suffix = "" if s.dt.tz is None else "Z"
+        if suffix:
+            s = s.dt.tz_convert("UTC")
+        # Keep the column object-typed so missing dates stay None, not NaN
+        iso = (s.dt.strftime("%Y-%m-%dT%H:%M:%S.%f").str[:-3] + suffix).astype(object)
+        out[col] = iso.where(s.notna(), None)
+    return out.to_dict(orient="records")
+
+
+def _dumps(payload: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=str)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Read and profile CSV files for Claude analysis")
     parser.add_argument("file", help="Path to CSV file")
@@ -199,58 +785,116 @@ def main() -> None:
     parser.add_argument("--encoding", default=None, help="File encoding (default: auto)")
     parser.add_argument("--sep", default=None, help="Delimiter (default: auto)")
     parser.add_argument("--no-data", action="store_true", help="Profile only, skip data output")
+    parser.add_argument("--engine", choices=["pyarrow", "c"],
+                        default="pyarrow" if pa_csv is not None and not MODIN else "c",
+                        help="CSV parser (default: pyarrow if installed, c under Modin)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and overwrite the cached profile")
     args = parser.parse_args()
 
     path = Path(args.file)
     if not path.exists():
         print(f"Error: File not found: {path}", file=sys.stderr)
         sys.exit(1)
+    if args.engine == "pyarrow" and pa_csv is None:
+        print("Error: --engine pyarrow requires pyarrow (pip install pyarrow)", file=sys.stderr)
+        sys.exit(1)
 
-    # Auto-detect encoding and separator
-    encoding = args.encoding or detect_encoding(path)
-    sep = args.sep or detect_sep(path, encoding)
+    # Profiles are cached beside the file; a hit skips parsing entirely
+    want_profile = args.profile or args.format == "summary"
+    profile_only = (args.profile and args.no_data) or args.format == "summary"
+    cache_key = profile_cache_key(path, args.encoding, args.sep, args.engine)
+    cached = None
+    if want_profile and not args.no_cache:
+        cached = load_cached_profile(path, cache_key)
+    if cached is not None and profile_only:
+        print(cached["profile"])
+        return
+
+    # Previews only need the leading rows, so stop reading there
+    n_out = args.head if args.head is not None else args.rows
+    needs_full = (want_profile and cached is None) or (args.head is None and args.rows == 0)
+    # Profile-only runs on large files never need the whole frame in memory
+    size = path.stat().st_size
+    streaming = profile_only and size > STREAM_PROFILE_BYTES
+
+    # Auto-detect encoding and separator (small full reads keep the bytes for parsing)
+    header, data = read_source(path, whole=needs_full and not streaming
+                               and size <= WHOLE_READ_BYTES)
+    encoding = args.encoding or detect_encoding(header)
+    sep = args.sep or detect_sep(header)
+
+    if streaming:
+        report, n_rows = profile_streaming(path, sep, encoding)
+        save_cached_profile(path, cache_key, report, n_rows)
+        print(report)
+        return
 
-    # Read
-    df = pd.read_csv(path, sep=sep, encoding=encoding, low_memory=False)
+    # Read (one row past the preview, to tell whether anything was cut off)
+    df = read_frame(data if data is not None else path, sep, encoding, args.engine,
+                    nrows=None if needs_full else n_out + 1)
+    del data
     df = infer_types(df)
 
     # Profile mode
-    if args.profile or args.format == "summary":
-        print(profile(df, path))
-        if args.no_data or args.format == "summary":
+    if want_profile:
+        if cached is None:
+            report = profile(df, path)
+            cached = {"profile": report, "rows": len(df)}
+            save_cached_profile(path, cache_key, report, len(df),
+                                {c: str(t) for c, t in df.dtypes.items()})
+        print(cached["profile"])
+        if profile_only:
             return
 
     # Data output
     if args.no_data:
         return
 
-    n_out = args.head if args.head is not None else (len(df) if args.rows == 0 else args.rows)
+    if args.head is None and args.rows == 0:
+        n_out = len(df)
     df_out = df.head(n_out)
+    if MODIN:
+        df_out = df_out._to_pandas()  # tabulate and to_dict need a plain pandas frame
     truncated = len(df_out) < len(df)
+    # A truncated preview read stopped early; the row count then comes from a
+    # cached profile if there is one, else from counting the file's rows
+    n_total = len(df)
+    if truncated and not needs_full:
+        n_total = (cached or {}).get("rows")
+        if n_total is None:
+            n_total = count_rows(path, sep, encoding)
+    total_known = n_total is not None
+    total_label = f"{n_total:,}" if total_known else f"{len(df_out):,}+"
 
     if args.format == "md":
         if not (args.profile or args.format == "summary"):
             print(f"# {path.name}\n")
-            print(f"**{df.shape[0]:,} rows × {df.shape[1]} columns** | "
+            print(f"**{total_label} rows × {df.shape[1]} columns** | "
                   f"encoding: {encoding} | sep: `{sep}`\n")
-        print(f"\n## Data ({len(df_out):,} of {len(df):,} rows)\n")
-        print(tabulate(df_out, headers="keys", tablefmt="pipe",
-                       showindex=False, floatfmt=".4f"))
+        print(f"\n## Data ({len(df_out):,} of {total_label} rows)\n")
+        table = _numpy_frame(df_out)
+        if len(table) > STREAM_TABLE_ROWS:
+            sys.stdout.flush()
+            _stream_markdown(table)
+        else:
+            print(tabulate(table, headers="keys", tablefmt="pipe",
+                           showindex=False, floatfmt=".4f"))
         if truncated:
-            print(f"\n*… {len(df) - len(df_out):,} more rows. Use --rows 0 to output all.*")
+            more = f"{n_total - len(df_out):,} more rows" if total_known else "more rows"
+            print(f"\n*… {more}. Use --rows 0 to output all.*")
 
     elif args.format == "json":
-        records = json.loads(df_out.to_json(orient="records", date_format="iso"))
-        print(json.dumps({
+        print(_dumps({
             "file": str(path),
             "encoding": encoding,
             "separator": sep,
-            "total_rows": len(df),
+            "total_rows": n_total,
             "output_rows": len(df_out),
             "columns": df.columns.tolist(),
             "dtypes": {c: str(t) for c, t in df.dtypes.items()},
-            "data": records
-        }, indent=2, ensure_ascii=False))
+            "data": _records(df_out)
+        }))
 
 
 if __name__ == "__main__":
@@ -14,6 +14,7 @@ Options:
     --head <n>             Show only first n rows (quick preview)
 
 Auto-installs: openpyxl, pandas, tabulate
+Optional: python-calamine (faster Excel parsing), orjson (faster JSON output)
 """
 
 import sys
@@ -32,10 +33,17 @@ except ImportError:
     import pandas as pd
 
 try:
-    import openpyxl  # noqa: F401 — required for pandas Excel engine
+    import openpyxl  # pandas Excel engine; also used directly for sheet dimensions
 except ImportError:
     print("Installing openpyxl...", file=sys.stderr)
     _install("openpyxl")
+    import openpyxl
+
+try:
+    import python_calamine  # noqa: F401 — optional Rust engine, pandas >= 2.2
+    EXCEL_ENGINE = "calamine" if tuple(map(int, pd.__version__.split(".")[:2])) >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl for .xlsx)
 
 try:
     from tabulate import tabulate
@@ -44,6 +52,11 @@ except ImportError:
     _install("tabulate")
     from tabulate import tabulate
 
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
+
 import argparse
 import json
 import os
@@ -116,6 +129,59 @@ def profile_dataframe(df: pd.DataFrame) -> str:
     return "\n".join(lines)
 
 
+def _records(df: pd.DataFrame) -> list[dict]:
+    """Row dicts for JSON output: ISO-8601 date strings, None for missing values."""
+    out = df.astype(object).where(df.notna(), None)
+    for col in df.columns[[d.kind == "M" for d in df.dtypes]]:
+        s = df[col]
+        # Timezone-aware dates are written in UTC with a Z suffix, as to_json does
+        suffix = "" if s.dt.tz is None else "Z"
+        if suffix:
+            s = s.dt.tz_convert("UTC")
+        # Keep the column object-typed so missing dates stay None, not NaN
+        iso = (s.dt.strftime("%Y-%m-%dT%H:%M:%S.%f").str[:-3] + suffix).astype(object)
+        out[col] = iso.where(s.notna(), None)
+    return out.to_dict(orient="records")
+
+
+def _dumps(payload: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=str)
+
+
+def sheet_dimensions(path: Path) -> list[tuple[str, int, int, bool]]:
+    """(name, rows, columns, declared) per sheet, header row excluded from rows.
+
+    For .xlsx/.xlsm this reads each sheet's declared <dimension> in openpyxl
+    read-only mode without decoding any cells. That range counts formatted
+    but empty cells and some writers leave it wrong, so those counts are
+    approximate and flagged with declared=True. Sheets without a usable
+    dimension (missing, or just "A1"), and other formats, are read with
+    pandas and reported exactly.
+    """
+    dims = []
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            for name in wb.sheetnames:
+                ws = wb[name]
+                declared = ws.max_row is not None and ws.max_column is not None
+                if not declared or ws.calculate_dimension() == "A1:A1":
+                    df = pd.read_excel(path, sheet_name=name, header=0, engine=EXCEL_ENGINE)
+                    dims.append((name, df.shape[0], df.shape[1], False))
+                else:
+                    dims.append((name, max(ws.max_row - 1, 0), ws.max_column, True))
+        finally:
+            wb.close()
+        return dims
+    for name in pd.ExcelFile(path, engine=EXCEL_ENGINE).sheet_names:
+        df = pd.read_excel(path, sheet_name=name, header=0, engine=EXCEL_ENGINE)
+        dims.append((name, df.shape[0], df.shape[1], False))
+    return dims
+
+
 def read_excel(
     path: str,
     sheet: str | int | None = None,
@@ -130,24 +196,24 @@ def read_excel(
         print(f"Error: File not found: {path}", file=sys.stderr)
         sys.exit(1)
 
-    xl = pd.ExcelFile(path)
-    sheet_names = xl.sheet_names
-
     # List all sheets
     if all_sheets:
         print(f"## Sheets in {path.name}\n")
-        for i, name in enumerate(sheet_names):
-            df = pd.read_excel(path, sheet_name=name, header=0)
-            print(f"- **Sheet {i}:** `{name}` — {df.shape[0]:,} rows × {df.shape[1]} columns")
+        for i, (name, n_rows, n_cols, declared) in enumerate(sheet_dimensions(path)):
+            note = " (declared size, may include empty formatted cells)" if declared else ""
+            print(f"- **Sheet {i}:** `{name}` — {n_rows:,} rows × {n_cols} columns{note}")
         return
 
+    xl = pd.ExcelFile(path, engine=EXCEL_ENGINE)
+    sheet_names = xl.sheet_names
+
     # Select sheet
     if sheet is None:
         sheet = sheet_names[0]
     elif sheet.isdigit():
         sheet = int(sheet)
 
-    df = pd.read_excel(path, sheet_name=sheet, header=0)
+    df = pd.read_excel(path, sheet_name=sheet, header=0, engine=EXCEL_ENGINE)
 
     # Header info
     sheet_label = sheet if isinstance(sheet, str) else sheet_names[sheet]
@@ -182,15 +248,14 @@ def read_excel(
             print(f"# … {len(df) - len(df_out):,} more rows", file=sys.stderr)
 
     elif fmt == "json":
-        records = json.loads(df_out.to_json(orient="records", date_format="iso"))
-        print(json.dumps({
+        print(_dumps({
             "file": str(path),
             "sheet": sheet_label,
             "total_rows": len(df),
             "output_rows": len(df_out),
             "columns": df.columns.tolist(),
-            "data": records
-        }, indent=2, ensure_ascii=False))
+            "data": _records(df_out)
+        }))
 
 
 def main() -> None: